@@ -1,7 +1,62 @@
 import numpy as np
+from concurrent.futures import ThreadPoolExecutor
 
 from .function import OptFunction
 
+try:
+    from numba import njit
+
+    @njit(cache=True, nogil=True)
+    def _take_cols_jit(src, idx, out):
+        """Gathers index-selected columns into the given output array"""
+        for j in range(idx.size):
+            c = idx[j]
+            for r in range(src.shape[0]):
+                out[r, j] = src[r, c]
+        return out
+
+except ImportError:
+    _take_cols_jit = None
+
+
+def _as_index_array(v):
+    """Materializes a variable subset as a contiguous index array"""
+    if isinstance(v, slice):
+        return np.arange(v.start, v.stop, dtype=np.intp)
+    return np.ascontiguousarray(v, dtype=np.intp)
+
+
+def _gather_cols(src, idx, out=None):
+    """Extracts the index-selected columns of a 2D array"""
+    if isinstance(src, np.ndarray) and src.ndim == 2:
+        if out is None:
+            out = np.empty((src.shape[0], idx.size), dtype=src.dtype)
+        if _take_cols_jit is not None:
+            return _take_cols_jit(src, idx, out)
+        np.take(src, idx, axis=1, out=out)
+        return out
+    return src[:, idx]
+
+
+def _index_spec(v):
+    """Classifies a variable subset as slice, take or empty indexing"""
+    idx = _as_index_array(v)
+    if idx.size == 0:
+        return ("empty", None)
+    if np.all(np.diff(idx) == 1):
+        return ("slice", slice(int(idx[0]), int(idx[-1]) + 1))
+    return ("take", idx)
+
+
+def _gather(arr, spec, axis=0):
+    """Extracts a variable subset along the given axis"""
+    kind, p = spec
+    if kind == "slice":
+        return arr[:, p] if axis else arr[p]
+    elif kind == "take":
+        return _gather_cols(arr, p) if axis else np.take(arr, p)
+    return arr[:, :0] if axis else arr[:0]
+
 
 class OptFunctionList(OptFunction):
     """
@@ -15,14 +70,21 @@ class OptFunctionList(OptFunction):
 
     Attributes
     ----------
-    func_vars_int: list of lists of int
+    func_vars_int: list of numpy.ndarray or slice
         For each added function, the subset of
         integer variables
-    func_vars_float: list of lists of int
+    func_vars_float: list of numpy.ndarray or slice
         For each added function, the subset of
         float variables
     sizes: list of int
         The components of each added function
+    executor: object or int, optional
+        An object with a `map` function, e.g. a
+        concurrent.futures.ThreadPoolExecutor, for
+        parallel function evaluation in population
+        calculations. An int is interpreted as the
+        number of threads of an internally created
+        thread pool
 
     :group: core
 
@@ -47,6 +109,7 @@ class OptFunctionList(OptFunction):
         self.func_vars_int = []
         self.func_vars_float = []
         self.sizes = []
+        self.executor = None
 
     def append(self, function):
         """
@@ -109,20 +172,29 @@ class OptFunctionList(OptFunction):
         self._vnamesi = []
         self._vnamesf = []
         self.sizes = []
+        seeni = set()
+        seenf = set()
         for f in self.functions:
             if not f.initialized:
                 f.initialize(verbosity)
-            self._vnamesi += f.var_names_int
-            self._vnamesf += f.var_names_float
+            for v in f.var_names_int:
+                if v not in seeni:
+                    seeni.add(v)
+                    self._vnamesi.append(v)
+            for v in f.var_names_float:
+                if v not in seenf:
+                    seenf.add(v)
+                    self._vnamesf.append(v)
             self.sizes.append(f.n_components())
-        self._vnamesi = list(dict.fromkeys(self._vnamesi))
-        self._vnamesf = list(dict.fromkeys(self._vnamesf))
+        self._n_comps = sum(self.sizes)
 
         def getv(vnames, fvnames):
             if not len(fvnames):
-                return []
+                return np.empty(0, dtype=np.intp)
             l = [vnames.index(v) for v in fvnames]
-            return np.s_[l[0] : l[-1]] if list(range(l[0], l[-1])) == l else l
+            if list(range(l[0], l[-1] + 1)) == l:
+                return np.s_[l[0] : l[-1] + 1]
+            return np.asarray(l, dtype=np.intp)
 
         self.func_vars_int = [
             getv(self._vnamesi, f.var_names_int) for f in self.functions
@@ -131,6 +203,50 @@ class OptFunctionList(OptFunction):
             getv(self._vnamesf, f.var_names_float) for f in self.functions
         ]
 
+        def flatten(arrs):
+            sizes = np.asarray([a.size for a in arrs], dtype=np.intp)
+            offs = np.concatenate([[0], np.cumsum(sizes)])
+            flat = (
+                np.concatenate(arrs) if len(arrs) else np.empty(0, dtype=np.intp)
+            )
+            return flat, offs
+
+        fvi = [_as_index_array(v) for v in self.func_vars_int]
+        fvf = [_as_index_array(v) for v in self.func_vars_float]
+        self._fvi_flat, self._fvi_offs = flatten(fvi)
+        self._fvf_flat, self._fvf_offs = flatten(fvf)
+        self._fvi_arrs = [
+            self._fvi_flat[self._fvi_offs[fi] : self._fvi_offs[fi + 1]]
+            for fi in range(self.n_functions)
+        ]
+        self._fvf_arrs = [
+            self._fvf_flat[self._fvf_offs[fi] : self._fvf_offs[fi + 1]]
+            for fi in range(self.n_functions)
+        ]
+        self._fvi_specs = [_index_spec(v) for v in self._fvi_arrs]
+        self._fvf_specs = [_index_spec(v) for v in self._fvf_arrs]
+        self._comp_offs = np.concatenate(
+            [[0], np.cumsum(np.asarray(self.sizes, dtype=np.intp))]
+        )
+        self._split_indices = self._comp_offs[1:-1]
+        self._fvf_local = [
+            {int(g): l for l, g in enumerate(arr)} for arr in self._fvf_arrs
+        ]
+        self._fvf_any = set(self._fvf_flat.tolist())
+        self._gbufs = {}
+        self._plan_pop = [
+            (
+                f.calc_population,
+                self._fvi_specs[fi],
+                self._fvf_specs[fi],
+                int(self._comp_offs[fi]),
+                int(self._comp_offs[fi + 1]),
+                (0, fi),
+                (1, fi),
+            )
+            for fi, f in enumerate(self.functions)
+        ]
+
         super().initialize(verbosity)
 
     def vardeps_int(self):
@@ -188,8 +304,24 @@ class OptFunctionList(OptFunction):
             The number of components.
 
         """
+        if self.initialized:
+            return self._n_comps
         return sum(self.sizes)
 
+    def _gather_pop(self, arr, spec, key, n_pop):
+        """
+        Helper function for population variable gathering,
+        reusing a cached buffer for the take case
+        """
+        kind, p = spec
+        if kind != "take" or not isinstance(arr, np.ndarray) or arr.ndim != 2:
+            return _gather(arr, spec, axis=1)
+        buf = self._gbufs.get(key)
+        if buf is None or buf.shape[0] < n_pop or buf.dtype != arr.dtype:
+            buf = np.empty((n_pop, p.size), dtype=arr.dtype)
+            self._gbufs[key] = buf
+        return _gather_cols(arr, p, out=buf[:n_pop])
+
     def split_individual(self, data):
         """
         Splits result values or other data into
@@ -207,13 +339,9 @@ class OptFunctionList(OptFunction):
             shapes: (n_func_components,)
 
         """
-        out = []
-        i0 = 0
-        for fi in range(self.n_functions):
-            i1 = i0 + self.sizes[fi]
-            out.append(data[i0:i1])
-            i0 = i1
-        return out
+        if not self.n_functions:
+            return []
+        return np.split(data, self._split_indices)
 
     def split_population(self, data):
         """
@@ -232,13 +360,9 @@ class OptFunctionList(OptFunction):
             shapes: (n_pop, n_func_components)
 
         """
-        out = []
-        i0 = 0
-        for fi in range(self.n_functions):
-            i1 = i0 + self.sizes[fi]
-            out.append(data[:, i0:i1])
-            i0 = i1
-        return out
+        if not self.n_functions:
+            return []
+        return np.split(data, self._split_indices, axis=1)
 
     def calc_individual(self, vars_int, vars_float, problem_results, components=None):
         """
@@ -264,7 +388,7 @@ class OptFunctionList(OptFunction):
 
         """
         cmpnts = np.arange(self.n_components()) if components is None else components
-        values = np.full(len(cmpnts), np.nan, dtype=np.float64)
+        values = np.empty(len(cmpnts), dtype=np.float64)
 
         i0 = 0
         j0 = 0
@@ -277,8 +401,8 @@ class OptFunctionList(OptFunction):
             )
             if cts is None or len(cts):
                 j1 = j0 + (self.sizes[fi] if cts is None else len(cts))
-                varsi = vars_int[self.func_vars_int[fi]]
-                varsf = vars_float[self.func_vars_float[fi]]
+                varsi = _gather(vars_int, self._fvi_specs[fi])
+                varsf = _gather(vars_float, self._fvf_specs[fi])
                 values[j0:j1] = f.calc_individual(varsi, varsf, problem_results, cts)
                 j0 = j1
             i0 = i1
@@ -308,27 +432,60 @@ class OptFunctionList(OptFunction):
 
         """
         n_pop = vars_float.shape[0]
+
+        if self.n_functions == 1:
+            f = self.functions[0]
+            varsi = self._gather_pop(vars_int, self._fvi_specs[0], (0, 0), n_pop)
+            varsf = self._gather_pop(vars_float, self._fvf_specs[0], (1, 0), n_pop)
+            values = np.asarray(
+                f.calc_population(varsi, varsf, problem_results, components),
+                dtype=np.float64,
+            )
+            # callers own the result and may modify it in-place, so never
+            # hand out a view of the inputs or the cached gather buffers
+            if any(
+                isinstance(a, np.ndarray) and np.shares_memory(values, a)
+                for a in (varsi, varsf, vars_int, vars_float)
+            ):
+                values = values.copy()
+            return values
+
         cmpnts = np.arange(self.n_components()) if components is None else components
-        values = np.full((n_pop, len(cmpnts)), np.nan, dtype=np.float64)
 
-        i0 = 0
-        j0 = 0
-        for fi, f in enumerate(self.functions):
-            i1 = i0 + self.sizes[fi]
+        calls = []
+        for fcalc, speci, specf, i0, i1, keyi, keyf in self._plan_pop:
             cts = (
                 None
                 if components is None
                 else [i - i0 for i in cmpnts if i >= i0 and i < i1]
             )
             if cts is None or len(cts):
-                j1 = j0 + (self.sizes[fi] if cts is None else len(cts))
-                varsi = vars_int[:, self.func_vars_int[fi]]
-                varsf = vars_float[:, self.func_vars_float[fi]]
-                values[:, j0:j1] = f.calc_population(varsi, varsf, problem_results, cts)
-                j0 = j1
-            i0 = i1
+                varsi = self._gather_pop(vars_int, speci, keyi, n_pop)
+                varsf = self._gather_pop(vars_float, specf, keyf, n_pop)
+                calls.append((fcalc, varsi, varsf, cts))
 
-        return values
+        if self.executor is not None and len(calls) > 1:
+
+            if isinstance(self.executor, int):
+                self.executor = ThreadPoolExecutor(max_workers=self.executor)
+
+            def _run(call):
+                fcalc, varsi, varsf, cts = call
+                return fcalc(varsi, varsf, problem_results, cts)
+
+            results = list(self.executor.map(_run, calls))
+
+        else:
+            results = [
+                fcalc(varsi, varsf, problem_results, cts)
+                for fcalc, varsi, varsf, cts in calls
+            ]
+
+        if not len(results):
+            return np.empty((n_pop, 0), dtype=np.float64)
+
+        values = np.concatenate(results, axis=1)
+        return values if values.dtype == np.float64 else values.astype(np.float64)
 
     def finalize_individual(self, vars_int, vars_float, problem_results, verbosity=1):
         """
@@ -352,13 +509,13 @@ class OptFunctionList(OptFunction):
             The component values, shape: (n_components,)
 
         """
-        values = np.full(self.n_components(), np.nan, dtype=np.float64)
+        values = np.empty(self.n_components(), dtype=np.float64)
 
         i0 = 0
         for fi, f in enumerate(self.functions):
             i1 = i0 + self.sizes[fi]
-            varsi = vars_int[self.func_vars_int[fi]]
-            varsf = vars_float[self.func_vars_float[fi]]
+            varsi = _gather(vars_int, self._fvi_specs[fi])
+            varsf = _gather(vars_float, self._fvf_specs[fi])
             values[i0:i1] = f.finalize_individual(
                 varsi, varsf, problem_results, verbosity
             )
@@ -391,13 +548,13 @@ class OptFunctionList(OptFunction):
 
         """
         n_pop = vars_float.shape[0]
-        values = np.full((n_pop, self.n_components()), np.nan, dtype=np.float64)
+        values = np.empty((n_pop, self.n_components()), dtype=np.float64)
 
         i0 = 0
         for fi, f in enumerate(self.functions):
             i1 = i0 + self.sizes[fi]
-            varsi = vars_int[:, self.func_vars_int[fi]]
-            varsf = vars_float[:, self.func_vars_float[fi]]
+            varsi = _gather(vars_int, self._fvi_specs[fi], axis=1)
+            varsf = _gather(vars_float, self._fvf_specs[fi], axis=1)
             values[:, i0:i1] = f.finalize_population(
                 varsi, varsf, problem_results, verbosity
             )
@@ -428,24 +585,31 @@ class OptFunctionList(OptFunction):
             The derivative values, shape: (n_sel_components,)
 
         """
-        cmpnts = np.arange(self.n_components()) if components is None else components
-        deriv = np.full(len(cmpnts), np.nan, dtype=np.float64)
+        cmpnts = None if components is None else np.asarray(components)
+        if cmpnts is not None and not len(cmpnts):
+            return np.empty(0, dtype=np.float64)
+
+        n_sel = self.n_components() if cmpnts is None else len(cmpnts)
+        deriv = np.full(n_sel, np.nan, dtype=np.float64)
+
+        if var not in self._fvf_any:
+            return deriv
 
         i0 = 0
         j0 = 0
         for fi, f in enumerate(self.functions):
             i1 = i0 + self.sizes[fi]
-            if var in list(self.func_vars_float[fi]):
+            vi = self._fvf_local[fi].get(var)
+            if vi is not None:
                 cts = (
                     None
-                    if components is None
-                    else [i - i0 for i in cmpnts if i >= i0 and i < i1]
+                    if cmpnts is None
+                    else (cmpnts[(cmpnts >= i0) & (cmpnts < i1)] - i0).tolist()
                 )
                 if cts is None or len(cts):
                     j1 = j0 + (self.sizes[fi] if cts is None else len(cts))
-                    varsi = vars_int[self.func_vars_int[fi]]
-                    varsf = vars_float[self.func_vars_float[fi]]
-                    vi = list(self.func_vars_float[fi]).index(var)
+                    varsi = _gather(vars_int, self._fvi_specs[fi])
+                    varsf = _gather(vars_float, self._fvf_specs[fi])
                     deriv[j0:j1] = f.ana_deriv(varsi, varsf, vi, components=cts)
                     j0 = j1
             i0 = i1
@@ -0,0 +1,55 @@
+import numpy as np
+
+import iwopy
+from iwopy.core import OptFunctionList
+
+
+class F1(iwopy.Objective):
+    def __init__(self, problem, name, vnames_float):
+        super().__init__(
+            problem, name, vnames_int=[], vnames_float=vnames_float, cnames=[name]
+        )
+
+    def n_components(self):
+        return 1
+
+    def maximize(self):
+        return [False]
+
+    def calc_individual(self, vars_int, vars_float, problem_results):
+        return [0.0]
+
+
+def test_func_vars():
+
+    p = iwopy.SimpleProblem(
+        "test", float_vars=["x", "y", "z"], init_values_float=[0, 0, 0]
+    )
+
+    flist = OptFunctionList(p, "flist")
+    flist.append(F1(p, "f0", ["x", "y", "z"]))
+    flist.append(F1(p, "f1", ["x", "z"]))
+    flist.append(F1(p, "f2", ["z", "x"]))
+    flist.append(F1(p, "f3", ["y"]))
+    flist.append(F1(p, "f4", []))
+    flist.initialize()
+
+    fv = flist.func_vars_float
+    print("func_vars_float =", fv)
+
+    assert fv[0] == slice(0, 3)
+    assert isinstance(fv[1], np.ndarray) and fv[1].dtype == np.intp
+    assert fv[1].tolist() == [0, 2]
+    assert isinstance(fv[2], np.ndarray) and fv[2].dtype == np.intp
+    assert fv[2].tolist() == [2, 0]
+    assert fv[3] == slice(1, 2)
+    assert isinstance(fv[4], np.ndarray) and fv[4].dtype == np.intp
+    assert fv[4].size == 0
+
+    for v in flist.func_vars_int:
+        assert isinstance(v, np.ndarray) and v.dtype == np.intp and v.size == 0
+
+
+if __name__ == "__main__":
+
+    test_func_vars()
@@ -17,10 +17,7 @@ class Obj1(iwopy.Objective):
     def calc_population(self, vars_int, vars_float, problem_results):
         x, y = vars_float[:, 0], vars_float[:, 1]
 
-        def f(x, y):
-            return x**2 + 2 * np.sin(3 * y) - y * x
-
-        return f(x, y)[:, None]
+        return (x**2 + 2 * np.sin(3 * y) - y * x)[:, None]
 
     def ana_grad(self, pvars0_float):
         x, y = pvars0_float
@@ -41,7 +38,8 @@ def _calc(p, f, p0, o, lim, pop):
     a = f.ana_grad(p0)
     print("a =", a)
 
-    d = a - g
+    d = np.subtract(a, g)
+    np.fabs(d, out=d)
     print("==> mismatch =", d)
 
     assert np.max(d) < lim